@@ -13,7 +13,6 @@
 Please See documentation on gdsctools.readthedocs.org
 
 """
-import pkg_resources
 import os
 import warnings
 
@@ -27,7 +26,21 @@ def set_logger_level(level="INFO"):
 
 
 try:
-    version = pkg_resources.require("gdsctools")[0].version
+    try:
+        import importlib.metadata as metadata
+    except ImportError:
+        # Python 3.7 has no importlib.metadata
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            metadata = None
+
+    if metadata is None:
+        import pkg_resources
+
+        version = pkg_resources.require("gdsctools")[0].version
+    else:
+        version = metadata.version("gdsctools")
     __version__ = version
 except:
     version = "0.17"
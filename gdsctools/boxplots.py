@@ -233,7 +233,8 @@ class BoxPlots(object):
             if "msi" in df.columns:
                 df.drop("msi", inplace=True, axis=1)
 
-        groups = df.groupby(["feature", mode])
+        # tissues are categories: only the combos found in the data are used
+        groups = df.groupby(["feature", mode], observed=True)
 
         # counts items in each category and fill with NA
         counts = groups.count().unstack().fillna(0)
@@ -257,7 +258,7 @@ class BoxPlots(object):
         """
 
         groups = df.query(mode + " in @categories", engine="python").groupby(
-            [mode, "feature"]
+            [mode, "feature"], observed=True
         )
 
         # TODO; move all this if block into a method
@@ -264,7 +264,10 @@ class BaseModels(object):
             if self.settings.include_media_factor:
                 self.media_dict[drug_name] = self.media_factor.loc[indices]
 
-            self.tissue_dict[drug_name] = self.tissue_factor.loc[indices]
+            # tissues without IC50 for this drug must not be categories of
+            # the factor used in the OLS formula
+            tissues = self.tissue_factor.loc[indices]
+            self.tissue_dict[drug_name] = tissues.cat.remove_unused_categories()
 
         # some preprocessing for the OLS computation.
         # We create the dummies for the tissue factor once for all
@@ -21,20 +21,79 @@ Provides readers to read the following formats
 - Drug Decoder table with :class:`DrugDecode`
 
 """
+import bz2
+import csv
+import gzip
+import hashlib
+import os
 import warnings
 
 from gdsctools.errors import GDSCToolsDuplicatedDrugError
 
 import pandas as pd
-import pylab
 import numpy as np
 import easydev
 
 import colorlog
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as pafeather
+except ImportError:
+    pacsv = None
+
+# CSV/TSV files shipped with gdsctools whose content is cached (Feather)
+_data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+_cached_files = [
+    os.path.join(_data_path, "IC50_10drugs.tsv"),
+    os.path.join(_data_path, "genomic_features.tsv.gz"),
+]
+# bump whenever the content of the Feather sidecars changes
+_cache_version = b"1"
+
 __all__ = ["IC50", "GenomicFeatures", "Reader", "DrugDecode"]
 
 
+def _read_header(filename, separator):
+    """Return the column names found on the first line of a CSV/TSV file"""
+    if filename.endswith(".gz"):
+        opener = gzip.open
+    elif filename.endswith(".bz2"):
+        opener = bz2.open
+    else:
+        opener = open
+    with opener(filename, "rt", newline="", encoding="utf-8-sig") as fin:
+        return next(csv.reader(fin, delimiter=separator, quotechar='"'))
+
+
+def _has_hexadecimal(data):
+    """Return True if the data (after the header) may contain 0x numbers"""
+    # 'x' is rare so each one is found and checked; this is much faster
+    # than searching '0x' in a matrix made of 0 and 1.
+    start = data.find(b"\n")
+    for x in (b"x", b"X"):
+        i = data.find(x, start)
+        while i != -1:
+            if data[i - 1 : i] == b"0":
+                return True
+            i = data.find(x, i + 1)
+    return False
+
+
+def _cache_key(filename):
+    """Return the key identifying the content of a file in the Feather cache"""
+    sha1 = hashlib.sha1()
+    with open(filename, "rb") as fin:
+        for chunk in iter(lambda: fin.read(1 << 20), b""):
+            sha1.update(chunk)
+    return {
+        b"cache_version": _cache_version,
+        b"source_sha1": sha1.hexdigest().encode(),
+    }
+
+
 def drug_name_to_int(name):
     # We want to remove the prefix Drug_
     # We also want to remove suffix _IC50 but in v18, we have names
@@ -208,15 +267,24 @@ class Reader(object):
             # be set to True. This also helps since spaces would be
             # interpreted as a string. Using skipinitialspace, the spaces
             # is converetd to NA
-            rawdf = pd.read_csv(
-                filename,
-                sep=separator,
-                comment="#",
-                na_values=na_values,
-                skipinitialspace=True,
-                compression=compression,
-                quotechar='"',
-            )
+            # pyarrow (if installed) parses large files much faster than
+            # pandas. If it cannot cope with the file, we fall back on pandas
+            rawdf = None
+            if pacsv is not None and compression in (None, "gzip", "bz2"):
+                rawdf = self._read_csv_arrow(filename, separator)
+            if rawdf is None:
+                rawdf = pd.read_csv(
+                    filename,
+                    sep=separator,
+                    comment="#",
+                    na_values=na_values,
+                    skipinitialspace=True,
+                    compression=compression,
+                    quotechar='"',
+                )
+                columns = self._select_columns(list(rawdf.columns))
+                if len(columns) != len(rawdf.columns):
+                    rawdf = rawdf[columns]
             # if sum([this.count('\t') for this in rawdf.columns])>2:
             #    print("Your input file does not seem to be comma"
             #        " separated. If tabulated, please rename with"
@@ -238,14 +306,20 @@ class Reader(object):
                 "%s  unnamed columns found and removed. " % len(columns)
                 + "Please fix your input file."
             )
-        self.df = rawdf.drop(columns, axis=1)
+            rawdf = rawdf.drop(columns, axis=1)
+        self.df = rawdf
 
-        # Some fields may be empty strings, which must be set as NA
+        # Some fields may be empty strings, which must be set as NA. Only
+        # string columns are concerned so numeric data is not copied
         import warnings
 
-        warnings.filterwarnings("ignore")
-        self.df = self.df.replace(" ", "").replace("\t", "").replace("", np.nan)
-        warnings.filterwarnings("default")
+        strings = self.df.columns[self.df.dtypes == object]
+        if len(strings) > 0:
+            warnings.filterwarnings("ignore")
+            self.df[strings] = (
+                self.df[strings].replace(" ", "").replace("\t", "").replace("", np.nan)
+            )
+            warnings.filterwarnings("default")
 
         # Finally, check that names do not contain the unwanted character
         # / that was used in some old matrices.
@@ -256,6 +330,153 @@ class Reader(object):
             )
             self.df.columns = [x.replace("/", "_") for x in self.df.columns]
 
+    def _read_csv_arrow(self, filename, separator):
+        """Read a CSV/TSV file with the multithreaded reader of pyarrow
+
+        :return: a dataframe or None if the file cannot be read by pyarrow
+            the same way pandas would (e.g. comments, spaces after the
+            separator, empty or duplicated column names, dates, no rows,
+            hexadecimal or very large integers). Those files are then read
+            with pandas.
+        """
+        if os.path.abspath(filename) in _cached_files:
+            table = self._load_cached(filename, separator)
+        else:
+            table = self._parse_csv_arrow(filename, separator)
+        if table is None:
+            return None
+        df = table.to_pandas()
+        # missing strings are None with pyarrow but NaN with pandas
+        strings = df.columns[df.dtypes == object]
+        if len(strings) > 0:
+            df[strings] = df[strings].fillna(np.nan)
+        return df
+
+    def _load_cached(self, filename, separator):
+        """Read a file shipped with gdsctools from its Feather sidecar
+
+        The IC50 and genomic features test files shipped with gdsctools are
+        read many times so their parsed content is cached in a Feather file
+        (filename + .feather). The cache is created if missing and ignored if
+        the SHA1 of the original file or the cache format version has
+        changed.
+        """
+        cache = filename + ".feather"
+        key = _cache_key(filename)
+        try:
+            with pa.memory_map(cache) as source:
+                schema = pa.ipc.open_file(source).schema
+            metadata = schema.metadata or {}
+            if all(metadata.get(k) == v for k, v in key.items()):
+                columns = self._select_columns(schema.names)
+                return pafeather.read_table(cache, columns=columns)
+        except (OSError, pa.ArrowException):
+            pass
+
+        table = self._parse_csv_arrow(filename, separator, select=False)
+        if table is None:
+            return None
+        # written aside and then moved so that other processes never read
+        # a partial cache
+        tmp = "%s.%s.tmp" % (cache, os.getpid())
+        try:
+            pafeather.write_feather(
+                table.replace_schema_metadata(key),
+                tmp,
+                compression="zstd",
+            )
+            os.replace(tmp, cache)
+        except (OSError, pa.ArrowException):
+            # e.g. read-only installation
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return table.select(self._select_columns(table.column_names))
+
+    def _parse_csv_arrow(self, filename, separator, select=True):
+        """Parse a CSV/TSV file into a pyarrow table (None on failure)
+
+        :param select: read only the columns returned by
+            :meth:`_select_columns`.
+        """
+        try:
+            # read the header only so that unwanted columns are never parsed
+            names = _read_header(filename, separator)
+        except (OSError, ValueError, StopIteration, csv.Error):
+            return None
+
+        if len(set(names)) != len(names):
+            return None
+        for name in names:
+            # pandas names empty headers "Unnamed: N"
+            if name == "" or "#" in name or name != name.lstrip():
+                return None
+
+        if select:
+            names = self._select_columns(names)
+        try:
+            with pa.input_stream(filename, compression="detect") as source:
+                data = source.read_buffer()
+            table = pacsv.read_csv(
+                pa.BufferReader(data),
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+                parse_options=pacsv.ParseOptions(delimiter=separator, quote_char='"'),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=names,
+                    strings_can_be_null=True,
+                ),
+            )
+        except (OSError, pa.ArrowException):
+            return None
+
+        # pandas reads the columns of a file without rows as objects
+        if table.num_rows == 0:
+            return None
+        # pyarrow reads hexadecimal numbers (0x10) as integers, whereas
+        # pandas keeps the strings
+        if any(pa.types.is_integer(x) for x in table.schema.types):
+            if _has_hexadecimal(data.to_pybytes()):
+                return None
+
+        floats = []
+        for i, field in enumerate(table.schema):
+            column = table.column(i)
+            if pa.types.is_temporal(field.type) or pa.types.is_binary(field.type):
+                return None
+            # pandas skips comments (#) and spaces after the separator, which
+            # pyarrow keeps so that numbers may end up in string columns.
+            # <NA> (and None in recent versions) are missing values for
+            # pandas only.
+            if pa.types.is_string(field.type):
+                match = pc.match_substring_regex(column, r"^\s|#|^(<NA>|None)$")
+                if pc.any(match).as_py():
+                    return None
+            if pa.types.is_floating(field.type):
+                floats.extend(column.chunks)
+            # empty columns are read as NaN by pandas, not as objects
+            if pa.types.is_null(field.type):
+                column = pa.nulls(len(table), pa.float64())
+                table = table.set_column(i, field.name, column)
+
+        # integers with a + sign or beyond int64 are read as floats by
+        # pyarrow, as integers or strings by pandas. Missing values are NaN
+        # here so that columns with missing values are not integral.
+        if floats:
+            values = pa.chunked_array(floats).to_numpy()
+            values = values.reshape(-1, table.num_rows)
+            if (np.abs(values) >= 2**63).any():
+                return None
+            if (values == np.floor(values)).all(axis=1).any():
+                return None
+        return table
+
+    def _select_columns(self, names):
+        """Return the names of the columns to be read from the input file
+
+        All columns are read by default. Children classes may override this
+        method to skip columns that would be dropped anyway.
+        """
+        return names
+
     def _interpret(self):
         pass
 
@@ -275,9 +496,10 @@ class Reader(object):
         cnames = self.session.cnames
         rnames = self.session.rnames
         data = self.session.data
-        df = pd.DataFrame(data=data.copy())
-        df.columns = [x.strip() for x in cnames]
-        df.index = [x.strip() for x in rnames]
+        # data is a new array each time it is fetched from the session
+        df = pd.DataFrame(data=data)
+        df.columns = pd.Index(cnames).str.strip()
+        df.index = pd.Index(rnames).str.strip()
         return df
 
     def __str__(self):
@@ -326,9 +548,15 @@ class CosmicRows(object):
 
     def _set_cosmic(self, cosmics):
         for cosmic in cosmics:
-            if cosmic not in self.cosmicIds:
+            if cosmic not in self.df.index:
                 raise ValueError("Unknown cosmic identifier")
         self.df = self.df.loc[cosmics]
+        self._remove_unused_categories()
+
+    def _remove_unused_categories(self):
+        # categories (e.g. tissues) of the rows that were dropped are removed
+        for name in self.df.columns[self.df.dtypes == "category"]:
+            self.df[name] = self.df[name].cat.remove_unused_categories()
 
     cosmicIds = property(
         _get_cosmic,
@@ -404,6 +632,11 @@ class IC50(Reader, CosmicRows):
 
         r.drugsIds = [1, 1000]
 
+    IC50s are stored as float64. To halve the memory used by large
+    matrices, they can be stored as float32 instead::
+
+        r = IC50(ic50_test, dtype=np.float32)
+
     .. versionchanged:: 0.9.10
         The column **COSMIC ID** should now be **COSMIC_ID**.
         Previous name is deprecated but still accepted.
@@ -412,13 +645,17 @@ class IC50(Reader, CosmicRows):
 
     cosmic_name = "COSMIC_ID"
 
-    def __init__(self, filename, v18=False):
+    def __init__(self, filename, v18=False, dtype=None):
         """.. rubric:: Constructor
 
         :param filename: input filename of IC50s. May also be an instance
             of :class:`IC50` or a valid dataframe. The data is stored as a
             dataframe in the attribute called :attr:`df`. Input file may be
             gzipped
+        :param dtype: if set (e.g. numpy.float32), the IC50s are cast to this
+            type. With float32, the matrix uses half the memory but keeps
+            only about 7 significant digits so that ANOVA results may
+            slightly differ from those obtained with float64 (default).
 
         """
         super(IC50, self).__init__(filename)
@@ -429,17 +666,26 @@ class IC50(Reader, CosmicRows):
             self._interpret()
             self.check()
 
+        if dtype is not None:
+            self.df = self.df.astype(dtype, copy=False)
+
+    def _select_columns(self, names):
+        # if at least one column starts with Drug_, all others but the
+        # COSMIC one are dropped in _interpret so no need to read them
+        if not any(x.startswith("Drug_") for x in names):
+            return names
+        cosmic_names = [self.cosmic_name, "COSMIC ID", "CL"]
+        return [x for x in names if x.startswith("Drug") or x in cosmic_names]
+
     def _interpret(self):
         # if there is at least one column that starts with Drug or drug or
         # DRUG or variant then all other columns are dropped except "COSMIC ID"
 
         # For back compatibility with data that mixes Drug identifiers and
         # genomic features:
-        _cols = [str(x) for x in self.df.columns]
         drug_prefix = None
-        for this in _cols:
-            if this.startswith("Drug_"):
-                drug_prefix = "Drug"
+        if self.df.columns.astype(str).str.startswith("Drug_").any():
+            drug_prefix = "Drug"
 
         _cols = [str(x) for x in self.df.columns]
         if "COSMIC ID" in _cols and self.cosmic_name not in _cols:
@@ -459,20 +705,18 @@ class IC50(Reader, CosmicRows):
 
         # If the data has not been interpreted, COSMIC column should be
         # found in the column and set as the index
-        _cols = [str(x) for x in self.df.columns]
         if self.cosmic_name in self.df.columns:
             self.df.set_index(self.cosmic_name, inplace=True)
-            _cols = [str(x) for x in self.df.columns]
             if drug_prefix:
-                columns = [x for x in _cols if x.startswith(drug_prefix)]
-                self.df = self.df[columns]
+                # columns may have been selected already when reading the file
+                mask = self.df.columns.astype(str).str.startswith(drug_prefix)
+                if not mask.all():
+                    self.df = self.df.loc[:, mask]
 
         # If already interpreted, COSMIC name should be the index already.
         # and should be integers, so let us cast to integer
         elif self.df.index.name == self.cosmic_name:
-            _cols = [str(x) for x in self.df.columns]
             if drug_prefix:
-                columns = [x for x in _cols if x.startswith(drug_prefix)]
                 columns = self.df.columns
                 assert len(columns) == len(set(columns))
                 self.df = self.df[columns]
@@ -504,7 +748,7 @@ class IC50(Reader, CosmicRows):
 
     def _set_drugs(self, drugs):
         for drug in drugs:
-            if drug not in self.drugIds:
+            if drug not in self.df.columns:
                 raise ValueError("Unknown drug name")
         self.df = self.df[drugs]
 
@@ -519,7 +763,7 @@ class IC50(Reader, CosmicRows):
         self.drugIds = tokeep
 
     def __contains__(self, item):
-        if item in self.drugIds:
+        if item in self.df.columns:
             return True
         else:
             return False
@@ -531,15 +775,18 @@ class IC50(Reader, CosmicRows):
         :return: the fraction of valid/measured IC50 per drug
 
         """
-        data = self.df.count() / len(self.df)
+        import pylab
+
+        values = self.df.to_numpy(copy=False)
+        data = (~pd.isna(values)).sum(axis=0) / values.shape[0]
         pylab.clf()
-        pylab.plot(data.values, **kargs)
+        pylab.plot(data, **kargs)
         pylab.grid()
-        pylab.xlim([0, len(self.drugIds) + 1])
+        pylab.xlim([0, self.df.shape[1] + 1])
         pylab.xlabel("Drug index")
         pylab.ylim([0, 1])
         pylab.ylabel("Percentage of valid IC50")
-        return data
+        return pd.Series(data, index=self.df.columns)
 
     def hist(self, bins=20, **kargs):
         """Histogram of the measured IC50
@@ -557,27 +804,31 @@ class IC50(Reader, CosmicRows):
             r.hist()
 
         """
+        import pylab
+
+        values = self.df.values.ravel()
         pylab.clf()
-        pylab.hist(self.get_ic50(), bins=bins, **kargs)
+        pylab.hist(values[~np.isnan(values)], bins=bins, **kargs)
         pylab.grid()
         pylab.xlabel("log IC50")
 
     def get_ic50(self):
         """Return all ic50 as a list"""
-        return [x for x in self.df.values.flatten() if not np.isnan(x)]
+        values = self.df.values.ravel()
+        return values[~np.isnan(values)].tolist()
 
     def __str__(self):
-        txt = "Number of drugs: %s\n" % len(self.drugIds)
+        txt = "Number of drugs: %s\n" % self.df.shape[1]
         txt += "Number of cell lines: %s\n" % len(self.df)
-        N = len(self.drugIds) * len(self.df)
-        Nna = self.df.isnull().sum().sum()
+        values = self.df.to_numpy(copy=False)
+        N = values.size
+        Nna = pd.isna(values).sum()
         if N != 0:
             txt += "Percentage of NA {0}\n".format(Nna / float(N))
         return txt
 
     def __repr__(self):
-        Nc = len(self.cosmicIds)
-        Nd = len(self.drugIds)
+        Nc, Nd = self.df.shape
         return "IC50 object <Nd={0}, Nc={1}>".format(Nd, Nc)
 
     """def __add__(self, other):
@@ -638,6 +889,19 @@ class GenomicFeatures(Reader, CosmicRows):
         We also strip the spaces to make sure there is "THIS" and "THIS " are
         the same.
 
+    .. versionchanged:: 1.1.1
+        The tissue column is stored as a categorical column. Setting a new
+        tissue name (e.g. ``gf.df.loc[0, "TISSUE_FACTOR"] = "new_name"``)
+        raises a TypeError; add it to the categories first with
+        ``gf.df["TISSUE_FACTOR"].cat.add_categories``. Besides,
+        ``gf.df["TISSUE_FACTOR"].unique()`` returns a Categorical instead of
+        an array, and groupby or :func:`pandas.get_dummies` on that column
+        create one group or column per category, even for tissues absent
+        from a subset of the rows (use ``groupby(..., observed=True)``).
+        :meth:`drop_tissue_in`, :meth:`keep_tissue_in` and
+        :meth:`drop_cosmic` remove unused categories, and
+        :attr:`unique_tissues` returns the categories (sorted by name).
+
     """
 
     colnames = easydev.AttrDict()
@@ -667,9 +931,7 @@ class GenomicFeatures(Reader, CosmicRows):
 
         # FIXME Remove columns related to Drug if any. Can be removed in
         # the future
-        self.df = self.df[
-            [x for x in self.df.columns if x.startswith("Drug_") is False]
-        ]
+        self.df = self.df.loc[:, ~self.df.columns.str.startswith("Drug_")]
 
         for this in ["Sample Name", "SAMPLE_NAME", "Sample_Name", "CELL_LINE"]:
             if this in self.df.columns:
@@ -725,6 +987,14 @@ class GenomicFeatures(Reader, CosmicRows):
 
         self._fix_empty_tissues(empty_tissue_name)
 
+        # Tissue names are repeated many times so they are stored as
+        # categories. unique() and isin() then work on the integer codes
+        tissue = self.colnames.tissue
+        self.df[tissue] = self.df[tissue].astype("category")
+
+    def _select_columns(self, names):
+        return [x for x in names if x.startswith("Drug_") is False]
+
     def _fix_empty_tissues(self, name="UNDEFINED"):
         # Sometimes, tissues may be empty so a nan is present. This lead to
         # to errors in ANOVA or Regression so we replace them with "UNDEFINED"
@@ -778,7 +1048,7 @@ class GenomicFeatures(Reader, CosmicRows):
 
     def _set_features(self, features):
         for feature in features:
-            if feature not in self.features:
+            if feature not in self.df.columns:
                 raise ValueError("Unknown feature name %s" % feature)
         features = [x for x in features if x.endswith("FACTOR") is False]
         features = self._special_names + features
@@ -793,7 +1063,7 @@ class GenomicFeatures(Reader, CosmicRows):
     tissues = property(_get_tissues, doc="return list of tissues")
 
     def _get_unique_tissues(self):
-        return list(self.df[self.colnames.tissue].unique())
+        return list(self.df[self.colnames.tissue].cat.categories)
 
     unique_tissues = property(_get_unique_tissues, doc="return set of tissues")
 
@@ -810,9 +1080,12 @@ class GenomicFeatures(Reader, CosmicRows):
 
 
         """
+        import pylab
+
         if self.colnames.tissue not in self.df.columns:
             return
-        data = pd.get_dummies(self.df[self.colnames.tissue]).sum()
+        # tissues sorted by name, not by count (see pie chart below)
+        data = self.df[self.colnames.tissue].value_counts(sort=False).sort_index()
         data.index = [x.replace("_", " ") for x in data.index]
         pylab.figure(1)
         pylab.clf()
@@ -847,7 +1120,7 @@ class GenomicFeatures(Reader, CosmicRows):
     def __str__(self):
         txt = "Genomic features distribution\n"
         try:
-            tissues = list(self.df[self.colnames.tissue].unique())
+            tissues = self.unique_tissues
             Ntissue = len(tissues)
             txt += "Number of unique tissues {0}".format(Ntissue)
             if Ntissue == 1:
@@ -871,19 +1144,18 @@ class GenomicFeatures(Reader, CosmicRows):
         else:
             txt += "MEDIA column: no\n"
 
-        # -3 since we have also the MSI, tissue, media columns
-        # TODO should use shift attribute ?
-        Nfeatures = len(self.features)
+        # shift since we have also the MSI, tissue, media columns
+        Nfeatures = self.df.shape[1]
         txt += "\nThere are {0} unique features distributed as\n".format(
             Nfeatures - self.shift
         )
 
-        n_mutations = len([x for x in self.df.columns if x.endswith("_mut")])
+        columns = self.df.columns
+        n_mutations = int(columns.str.endswith("_mut").sum())
+        n_gain = int(columns.str.startswith("gain_cna").sum())
+        n_loss = int(columns.str.startswith("loss_cna").sum())
         txt += "- Mutation: {}\n".format(n_mutations)
-
-        n_gain = len([x for x in self.df.columns if x.startswith("gain_cna")])
         txt += "- CNA (gain): {}\n".format(n_gain)
-        n_loss = len([x for x in self.df.columns if x.startswith("loss_cna")])
         txt += "- CNA (loss): {}".format(n_loss)
         return txt
 
@@ -897,8 +1169,9 @@ class GenomicFeatures(Reader, CosmicRows):
 
         """
         tissues = easydev.to_list(tissues)
-        mask = self.df[self.colnames.tissue].isin(tissues) == False
-        self.df = self.df[mask]
+        mask = self.df[self.colnames.tissue].isin(tissues).to_numpy()
+        self.df = self.df.loc[~mask]
+        self._remove_unused_categories()
         self._cleanup()
 
     def keep_tissue_in(self, tissues):
@@ -911,26 +1184,26 @@ class GenomicFeatures(Reader, CosmicRows):
 
         """
         tissues = easydev.to_list(tissues)
-        mask = self.df[self.colnames.tissue].isin(tissues)
-        self.df = self.df[mask]
+        mask = self.df[self.colnames.tissue].isin(tissues).to_numpy()
+        self.df = self.df.loc[mask]
+        self._remove_unused_categories()
         self._cleanup()
 
     def _cleanup(self, required_features=0):
-        # FIXME: there is view/copy warning here in pandas. it should be fixed
-        # or may have side-effects
-        to_ignore = self._special_names
-        # create a view ignoring the informative columns
-        view = self.df[[x for x in self.df.columns if x not in to_ignore]]
-
-        todrop = list(view.columns[view.sum() <= required_features])
+        # sum all numeric columns rather than creating a copy of the
+        # dataframe without the informative columns, which are then ignored
+        sums = self.df.sum(axis=0, numeric_only=True)
+        mask = sums.values <= required_features
+        mask &= ~sums.index.isin(self._special_names)
+        todrop = list(sums.index[mask])
 
         self.df.drop(todrop, axis=1, inplace=True)
 
     def __repr__(self):
-        Nc = len(self.cosmicIds)
-        Nf = len(self.features) - self.shift
+        Nc = self.df.shape[0]
+        Nf = self.df.shape[1] - self.shift
         try:
-            Nt = len(set(self.tissues))
+            Nt = len(self.unique_tissues)
         except:
             Nt = "?"
         return "GenomicFeatures <Nc={0}, Nf={1}, Nt={2}>".format(Nc, Nf, Nt)
@@ -1040,7 +1313,10 @@ class Extra(Reader):  # pragma: no cover
 
     def hist_residuals(self, bins=100):
         """Plot residuals across all drugs and cell lines"""
-        data = [x for x in self.dfResv17.fillna(0).values.flatten() if x != 0]
+        import pylab
+
+        values = self.dfResv17.values.ravel()
+        data = values[~np.isnan(values) & (values != 0)]
         pylab.clf()
         pylab.hist(data, bins=bins, normed=True)
         pylab.grid(True)
@@ -1061,7 +1337,10 @@ class Extra(Reader):  # pragma: no cover
         )
 
     def hist_ic50(self, bins=100):
-        data = [x for x in self.dfIC50v17.fillna(0).values.flatten() if x != 0]
+        import pylab
+
+        values = self.dfIC50v17.values.ravel()
+        data = values[~np.isnan(values) & (values != 0)]
         pylab.clf()
         pylab.hist(data, bins=bins, normed=True)
         pylab.grid(True)
@@ -1069,7 +1348,10 @@ class Extra(Reader):  # pragma: no cover
         pylab.ylabel(r"\#")
 
     def hist_auc(self, bins=100):
-        data = [x for x in self.dfAUCv17.fillna(0).values.flatten() if x != 0]
+        import pylab
+
+        values = self.dfAUCv17.values.ravel()
+        data = values[~np.isnan(values) & (values != 0)]
         pylab.clf()
         pylab.hist(data, bins=bins, normed=True)
         pylab.grid(True)
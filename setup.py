@@ -84,6 +84,8 @@ setup(
     # so '' :['README.rst'] will include all README.rst recursively
     package_data = {
         '': ["*.js", "*txt", "*.csv", "*tsv", "*.gz"],
+        'gdsctools.data': ['IC50_10drugs.tsv.feather',
+                           'genomic_features.tsv.gz.feather'],
         'gdsctools.pipelines': ['*.rules', '*.yaml'],
         'gdsctools.data.css': ['*.css'],
         'gdsctools.data.images' : ['*.png', '*.ico'],
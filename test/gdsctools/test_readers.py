@@ -3,6 +3,7 @@ from gdsctools.readers import Reader, drug_name_to_int
 from easydev import TempFile
 from gdsctools import ic50_test, gdsctools_data
 import pandas as pd
+import gzip
  
 from gdsctools.datasets import testing
 
@@ -46,6 +47,12 @@ def test_read_ic50():
     r.to_csv(f.name)
     f.delete()
 
+    # IC50s may be stored as float32
+    r32 = IC50(ic50_test, dtype="float32")
+    assert all(r32.df.dtypes == "float32")
+    print(r32)
+    r32.hist()
+
     # columns may be duplicated
     r = IC50(ic50_test)
     df = pd.concat([r.df, r.df[999]], axis=1)
@@ -100,6 +107,7 @@ def test_read_gf():
     assert r.shift == 2
 
     assert len(r.unique_tissues) == 2
+    assert len(r.df.groupby("TISSUE_FACTOR").size()) == 2
 
     gf1 = GenomicFeatures()
 
@@ -161,3 +169,56 @@ def test_reader_long_strings():
     assert drug_name_to_int("1234567890123456789") == 1234567890123456789
     assert drug_name_to_int(str(2**63)) == 9223372036854775808
 
+
+def _read_without_pyarrow(filename):
+    from gdsctools import readers
+    pacsv, readers.pacsv = readers.pacsv, None
+    try:
+        return Reader(filename)
+    finally:
+        readers.pacsv = pacsv
+
+
+def test_read_without_pyarrow(tmpdir):
+    # files are copied outside gdsctools/data so that they are parsed
+    # and not read from the cache
+    data = "COSMIC_ID,TISSUE_FACTOR,Drug_1_IC50\n1,breast,0.5\n2,,\n"
+    filename = str(tmpdir.join("test.csv"))
+    with open(filename, "w") as fout:
+        fout.write(data)
+    r = Reader(filename)
+    assert r._read_csv_arrow(filename, ",") is not None
+    pd.testing.assert_frame_equal(r.df, _read_without_pyarrow(filename).df)
+
+    filename = str(tmpdir.join("test.tsv.gz"))
+    with gzip.open(filename, "wt") as fout:
+        fout.write(data.replace(",", "\t"))
+    r = Reader(filename)
+    assert r._read_csv_arrow(filename, "\t") is not None
+    pd.testing.assert_frame_equal(r.df, _read_without_pyarrow(filename).df)
+
+
+def test_read_pyarrow_fallback(tmpdir):
+    # files that pyarrow does not read as pandas does are read by pandas
+    header = "COSMIC_ID,Drug_1_IC50,Drug_2_IC50\n"
+    tests = {
+        "empty_name": ",COSMIC_ID,Drug_1_IC50\n0,1,2.5\n1,2,3.5\n",
+        "duplicated_names": "COSMIC_ID,Drug_1_IC50,Drug_1_IC50\n1,2.5,1\n",
+        "comment_header": "# comment\n" + header + "1,0.5,1.0\n",
+        "comment_row": header + "1,0.5,1.0\n#3,0.1,0.2\n2,0.3,0.4\n",
+        "inline_comment": header + "1,0.5,1.0 # comment\n2,0.3,0.4\n",
+        "spaces": header + "1, 0.5,1.0\n2,0.3, \n",
+        "spaces_strings": "COSMIC_ID,TISSUE_FACTOR\n1, breast\n2,lung\n",
+        "header_only": header,
+        "wide_integers": header + "99999999999999999999,0.5,1.0\n2,0.3,0.4\n",
+        "signed_integers": header + "+1,0.5,1.0\n2,0.3,0.4\n",
+        "hexadecimal": header + "0x10,0.5,1.0\n2,0.3,0.4\n",
+        "na_strings": "COSMIC_ID,TISSUE_FACTOR\n1,<NA>\n2,lung\n",
+    }
+    for name, data in tests.items():
+        filename = str(tmpdir.join(name + ".csv"))
+        with open(filename, "w") as fout:
+            fout.write(data)
+        r = Reader(filename)
+        assert r._read_csv_arrow(filename, ",") is None, name
+        pd.testing.assert_frame_equal(r.df, _read_without_pyarrow(filename).df)